@@ -0,0 +1,37 @@
+"""
+gunicorn.conf.py
+
+Serves wsgi:app with a single gevent worker and runs the scraper alongside it
+through `python scraper.py supervise`, which restarts the scraper whenever it
+exits. The supervisor, not the arbiter, is the scraper's parent: the arbiter
+reaps every child it has, so it could never report the scraper's real exit code.
+The supervisor is launched as a fresh interpreter rather than forked, so the
+gunicorn master never imports Playwright before gevent monkey-patches the worker.
+"""
+import os
+import subprocess
+import sys
+
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+workers = 1
+worker_connections = 1000
+keepalive = 5
+
+_SCRAPER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper.py")
+_supervisor = None
+
+def on_starting(server):
+    global _supervisor
+    _supervisor = subprocess.Popen([sys.executable, _SCRAPER_SCRIPT, "supervise"])
+    server.log.info("Started scraper supervisor (pid %s)", _supervisor.pid)
+
+def on_exit(server):
+    if _supervisor is None or _supervisor.poll() is not None:
+        return
+    _supervisor.terminate()
+    try:
+        # The supervisor itself waits up to 5s for the scraper to stop
+        _supervisor.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        _supervisor.kill()
@@ -2,32 +2,39 @@
 """
 scraper_service.py
 
-- Uses Selenium to load a JS-rendered page and BeautifulSoup to parse it.
-- Keeps latest_data in memory, atomically writes crypto_data.json (and backup).
+- Uses Playwright (headless Chromium) to load a JS-rendered page and selectolax (Lexbor) to parse it.
+- Runs the scraper in a child process that atomically writes crypto_data.json (and backup);
+  the Flask process mmaps that file whenever it changes and serves pre-rendered responses.
 - Provides Flask endpoints:
     GET /latest  -> returns the latest JSON (raw)
-    GET /health  -> returns simple health status
-- Fault tolerant: retries, keeps last_valid_data, can restart the webdriver on errors.
+    GET /health  -> returns health status (503 until the first scrape, or once the snapshot is stale)
+- Fault tolerant: retries, keeps last_valid_data, can restart the browser on errors.
+
+Run `python scraper.py` for the dev server + scraper, `python scraper.py scrape`
+for the scraper alone, `python scraper.py supervise` for the scraper restarted
+whenever it exits, or `gunicorn -c gunicorn.conf.py wsgi:app` in production.
 """
 import os
 import tempfile
 import shutil
-import json
+import hashlib
+import mmap
 import time
-import threading
+import multiprocessing
 import signal
-from threading import Lock, Thread
+import subprocess
+import sys
 import random
+from html import escape
+from itertools import islice
 
+import orjson
 from flask import Flask, jsonify, Response
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-# Selenium imports
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+# Playwright imports
+from playwright.sync_api import sync_playwright
 
 # -------------------------
 # CONFIG (edit as needed)
@@ -36,43 +43,92 @@ TARGET_URL = "https://www.binance.com/en/markets"
 
 ROW_SELECTOR = "div.overview-table-row"
 POLL_INTERVAL = 2.0               
-INITIAL_LOAD_DELAY = 5.0          
+ROW_WAIT_TIMEOUT = 10.0          
 JSON_FILE = "crypto_data.json"
 BACKUP_FILE = "crypto_data_backup.json"
+STALE_AFTER = 90.0                # snapshots not re-confirmed by a scrape within this many seconds are stale
 
 MAX_ROWS = None
 
+MAX_BACKOFF = 30.0                # cap for the jittered retry delay (seconds)
+CIRCUIT_BREAKER_FAILURES = 5      # consecutive failures before a long cooldown
+CIRCUIT_BREAKER_COOLDOWN = 60.0
+
+SCRAPER_CHECK_INTERVAL = 5.0      # supervise mode: how often to check the scraper child
+SCRAPER_RESTART_DELAY = 5.0       # supervise mode: pause before restarting it
+
+# Asset URLs the page never needs for the market rows (blocked inside Chromium;
+# the trailing * also matches query strings)
+BLOCKED_URL_PATTERNS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    "*.css*", "*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.mp4*", "*.webm*",
+]
+
 # -------------------------
 # Global state
 # -------------------------
-latest_data = []          
-latest_data_lock = Lock()
-stop_event = threading.Event()
+# latest_data and the cached response bodies are immutable bytes that are
+# only ever rebound, so readers just grab the current reference without a lock.
+latest_data = b""         # scraper process: last valid snapshot, as encoded by encode_json
+stop_event = multiprocessing.Event()
+_row_pool = []            # scraper process: row dicts reused by parse_market_from_html
+_last_digest = None       # scraper process: blake2b of the last snapshot written to JSON_FILE
+_snapshot_key = None      # server process: (st_ino, st_mtime_ns, st_size) of the JSON_FILE last seen
+_snapshot_digest = None   # server process: blake2b of the JSON_FILE content last rendered
+_snapshot_parts = None    # server process: (/latest body without timestamp, /htmlpage rows) for that content
+_snapshot_scraped_at = None  # server process: epoch time of the last scrape behind the cached responses
+_latest_payload = b""     # server process: pre-encoded /latest response body
+_html_payload = b""       # server process: pre-rendered /htmlpage response body
 
 # -------------------------
 # Helpers: atomic save
 # -------------------------
-def save_json_atomic(path, data, backup_path=None):
+def encode_json(data):
+    """Serialize data to the UTF-8 bytes written to JSON_FILE."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+def save_json_atomic(path, data, backup_path=None, durable=False):
     """
     Atomically write JSON to 'path'. Keep a backup if backup_path is provided.
     Create temp file in same directory to avoid cross-drive issues on Windows.
+    'data' may be pre-encoded bytes (see encode_json). Returns True on success.
+    The rename keeps readers from seeing partial files; pass durable=True to
+    also fsync before it (snapshots are re-scraped anyway, so off by default).
     """
     if not data:
-        return
+        return False
+    buf = data if isinstance(data, bytes) else encode_json(data)
 
     dir_path = os.path.dirname(os.path.abspath(path)) or "."
     fd, tmp_path = tempfile.mkstemp(dir=dir_path)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-            f.flush()
-            os.fsync(f.fileno())
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         if backup_path and os.path.exists(path):
+            # Hardlink the current snapshot aside instead of copying it; the
+            # rename below gives 'path' a new inode, so the backup keeps the old one.
+            # Link under a temp name first so backup_path is replaced atomically.
+            backup_tmp = f"{backup_path}.{os.getpid()}.tmp"
             try:
-                shutil.copy2(path, backup_path)
+                if os.path.lexists(backup_tmp):
+                    os.remove(backup_tmp)
+                try:
+                    os.link(path, backup_tmp)
+                except OSError:
+                    shutil.copy2(path, backup_tmp)
+                os.replace(backup_tmp, backup_path)
             except Exception as e:
                 print("Warning: failed to write backup:", e)
+                try:
+                    if os.path.lexists(backup_tmp):
+                        os.remove(backup_tmp)
+                except OSError:
+                    pass
         os.replace(tmp_path, path)
+        return True
     except Exception as e:
         print("Error saving JSON atomically:", e)
         try:
@@ -80,146 +136,334 @@ def save_json_atomic(path, data, backup_path=None):
                 os.remove(tmp_path)
         except Exception:
             pass
+        return False
+
+def save_snapshot(buf):
+    """
+    Write encoded snapshot 'buf' to JSON_FILE (with backup) unless it is
+    identical to the last snapshot written.
+    Returns "written", "unchanged" (digest matched, nothing written) or "failed".
+    """
+    global _last_digest
+    digest = hashlib.blake2b(buf, digest_size=16).digest()
+    if digest == _last_digest:
+        return "unchanged"
+    if save_json_atomic(JSON_FILE, buf, backup_path=BACKUP_FILE):
+        _last_digest = digest
+        return "written"
+    return "failed"
+
+def touch_snapshot():
+    """
+    Bump JSON_FILE's mtime without rewriting it. The mtime is the time of the
+    last successful scrape, so an unchanged market still reads as fresh.
+    """
+    try:
+        os.utime(JSON_FILE)
+    except OSError:
+        pass
+
+def discard_snapshot():
+    """Remove a JSON_FILE left over from an earlier run (BACKUP_FILE is kept)."""
+    try:
+        os.remove(JSON_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print("Warning: failed to discard previous snapshot:", e)
 
 # -------------------------
-# Selenium driver creation
+# Snapshot publishing
 # -------------------------
-def create_driver():
-    """Create a Chrome webdriver (headless)."""
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")  
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--log-level=3")
-    # In some environments may need:
-    # options.add_argument("--disable-gpu")
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.set_page_load_timeout(30)
-    return driver
+def render_html_rows(data):
+    """Render the /htmlpage table rows for a snapshot (fields are HTML-escaped)."""
+    # Escape each field once into plain tuples, then format by position
+    cells = [
+        (escape(item["pair"]), escape(item["price"]), escape(item["change_24h"]))
+        for item in data
+    ]
+    return "".join(
+        f"<tr><td>{pair}</td><td>{price}</td><td>{change}</td></tr>"
+        for pair, price, change in cells
+    )
+
+def render_html_page(rows, timestamp):
+    """Wrap pre-rendered table rows into the /htmlpage body."""
+    return f"""
+        <meta http-equiv="refresh" content="1">
+        <h2>Crypto Market Data</h2>
+        <p>Last updated: {timestamp}</p>
+        <table border="1" cellpadding="5" cellspacing="0">
+            <tr>
+                <th>Pair</th>
+                <th>Price</th>
+                <th>Change (24h)</th>
+            </tr>
+            {rows}
+        </table>
+        """
+
+def publish_snapshot(data, scraped_at):
+    """
+    Swap in a new snapshot: encode/render its timestamp-independent parts once,
+    then stamp the /latest and /htmlpage responses with the scrape time.
+    """
+    global _snapshot_parts
+    body = orjson.dumps({"count": len(data), "data": data})
+    _snapshot_parts = (body, render_html_rows(data))
+    stamp_snapshot(_snapshot_parts, scraped_at)
+
+def stamp_snapshot(parts, scraped_at):
+    """Rebuild the cached responses from pre-rendered parts with a new scrape time."""
+    global _latest_payload, _html_payload, _snapshot_scraped_at
+    body, rows = parts
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(scraped_at))
+    # Splice "timestamp" in as the first key of the already-encoded body
+    _latest_payload = b'{"timestamp":' + orjson.dumps(timestamp) + b"," + body[1:]
+    _html_payload = render_html_page(rows, timestamp).encode("utf-8")
+    _snapshot_scraped_at = scraped_at
+
+def refresh_snapshot():
+    """
+    Pick up changes to JSON_FILE (written by the scraper process). The file's
+    mtime is the last scrape time; files older than STALE_AFTER (left over from
+    an earlier run, or from a dead scraper) are never loaded.
+
+    A new (st_ino, st_mtime_ns, st_size) only triggers a hash of the file. If
+    the content matches what is already rendered (the scraper just touched the
+    file after an unchanged scrape), the responses are only re-stamped with the
+    new scrape time; the file is decoded and re-rendered only when it differs.
+    """
+    global _snapshot_key, _snapshot_digest
+    try:
+        st = os.stat(JSON_FILE)
+        # Every save is an os.replace, so a new write always means a new inode,
+        # even where mtime is too coarse to tell two writes apart
+        if (st.st_ino, st.st_mtime_ns, st.st_size) == _snapshot_key:
+            return
+        if time.time() - st.st_mtime > STALE_AFTER:
+            return
+        with open(JSON_FILE, "rb") as f:
+            st = os.fstat(f.fileno())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    digest = hashlib.blake2b(view, digest_size=16).digest()
+                    data = None if digest == _snapshot_digest else orjson.loads(view)
+    except FileNotFoundError:
+        # Scraper has not written a snapshot yet: just "no data yet"
+        return
+    except (OSError, ValueError) as e:
+        print("Warning: failed to load snapshot:", e)
+        return
+    _snapshot_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    if digest == _snapshot_digest:
+        stamp_snapshot(_snapshot_parts, st.st_mtime)
+    elif data:
+        _snapshot_digest = digest
+        publish_snapshot(data, st.st_mtime)
+
+# -------------------------
+# Playwright browser creation
+# -------------------------
+def create_browser():
+    """Start Playwright and launch a headless Chromium browser."""
+    pw = sync_playwright().start()
+    try:
+        browser = pw.chromium.launch(
+            headless=True,
+            args=["--no-sandbox", "--disable-dev-shm-usage"],
+            # In some environments may need: "--disable-gpu"
+        )
+    except Exception:
+        pw.stop()
+        raise
+    return pw, browser
+
+def create_page(browser):
+    """Open one browser context + page, reused across polls."""
+    context = browser.new_context()
+    page = context.new_page()
+    # Let Chromium drop asset requests itself (no per-request round trip through
+    # Python, which would stall the page while the scraper sleeps between polls)
+    cdp = context.new_cdp_session(page)
+    cdp.send("Network.enable")
+    cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    page.set_default_navigation_timeout(30_000)
+    return page
+
+def close_page(page):
+    """Close a page together with its browser context, ignoring errors."""
+    try:
+        if page:
+            page.context.close()
+    except Exception:
+        pass
+
+def close_browser(pw, browser):
+    """Shut down the browser and the Playwright driver, ignoring errors."""
+    try:
+        if browser:
+            browser.close()
+    except Exception:
+        pass
+    try:
+        if pw:
+            pw.stop()
+    except Exception:
+        pass
 
 # -------------------------
 # Scraping/parsing function
 # -------------------------
 def parse_market_from_html(html):
     """
-    Parse page HTML with BeautifulSoup and return a list of dicts:
+    Parse page HTML with selectolax (Lexbor C parser) and return a list of dicts:
     [{"pair": "...", "price": "...", "change_24h": "..."}, ...]
     Adjust parsing logic depending on target site structure.
+    The dicts come from _row_pool and are overwritten by the next call, so
+    encode the result before parsing again.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.select(ROW_SELECTOR)
-    results = []
+    tree = LexborHTMLParser(html)
+    rows = tree.css(ROW_SELECTOR)
+    n = 0
     for row in rows:
-        text = row.get_text(separator="\n").strip()
-        parts = [p.strip() for p in text.split("\n") if p.strip() != ""]
-        if len(parts) >= 3:
-            pair = parts[0]
-            price = parts[1]
-            change_24h = parts[2]
-            results.append({"pair": pair, "price": price, "change_24h": change_24h})
-        if MAX_ROWS and len(results) >= MAX_ROWS:
+        text = row.text(separator="\n", strip=True)
+        # text(strip=True) can still emit empty chunks, so filter them; islice
+        # stops filtering after the first 3 (split itself still walks the whole text)
+        parts = list(islice(filter(None, text.split("\n")), 3))
+        if len(parts) == 3:
+            if n >= len(_row_pool):
+                _row_pool.append({"pair": "", "price": "", "change_24h": ""})
+            item = _row_pool[n]
+            item["pair"], item["price"], item["change_24h"] = parts
+            n += 1
+        if MAX_ROWS and n >= MAX_ROWS:
             break
-    return results
+    return _row_pool[:n]
 
 # -------------------------
 # Main scraping loop
 # -------------------------
-def scrape_loop():
+def scrape_loop(stop=stop_event):
     """
-    Background loop: maintain webdriver, fetch page_source, parse with BS,
-    update latest_data (with lock) and atomically write JSON files.
+    Scraper process: maintain browser page, fetch the row markup, parse with selectolax,
+    keep the encoded latest_data and atomically write JSON files for the server process.
     """
     global latest_data
-    driver = None
+    # Never let the server pick up a snapshot this scraper did not write
+    discard_snapshot()
+    pw = browser = page = None
     backoff = 1.0
+    failures = 0
 
-    while not stop_event.is_set():
+    while not stop.is_set():
         try:
-            if driver is None:
-                print("Starting webdriver...")
-                driver = create_driver()
-                driver.get(TARGET_URL)
-                time.sleep(INITIAL_LOAD_DELAY)  
+            if page is None:
+                if browser is None:
+                    print("Starting browser...")
+                    pw, browser = create_browser()
+                print("Opening page...")
+                page = create_page(browser)
+                # Return at DOMContentLoaded and wait only until rows appear
+                page.goto(TARGET_URL, wait_until="domcontentloaded")
+                page.wait_for_selector(ROW_SELECTOR, timeout=ROW_WAIT_TIMEOUT * 1000)
             else:
                 try:
-                    driver.execute_script("window.scrollTo(0, 0);")
+                    page.evaluate("window.scrollTo(0, 0);")
                 except Exception:
                     pass
 
-            html = driver.page_source
+            # Serialize only the market rows, not the whole DOM
+            html = page.eval_on_selector_all(
+                ROW_SELECTOR, "rows => rows.map(r => r.outerHTML).join('')"
+            )
             parsed = parse_market_from_html(html)
 
             if parsed:
-                with latest_data_lock:
-                    latest_data = parsed
-                save_json_atomic(JSON_FILE, latest_data, backup_path=BACKUP_FILE)
-                print(f"Saved {len(latest_data)} items to {JSON_FILE}")
+                latest_data = encode_json(parsed)
+                result = save_snapshot(latest_data)
+                if result == "written":
+                    print(f"Saved {len(parsed)} items to {JSON_FILE}")
+                elif result == "unchanged":
+                    # Same content as on disk: only record the scrape time.
+                    # Never on "failed", or old prices would look freshly scraped.
+                    touch_snapshot()
                 backoff = 1.0
+                failures = 0
             else:
-                
-                with latest_data_lock:
-                    to_save = latest_data.copy()
-                if to_save:
-                    save_json_atomic(JSON_FILE, to_save, backup_path=BACKUP_FILE)
-                    print("⚠️ Parsed empty this iteration — re-saved last valid snapshot.")
+                # Last valid snapshot is already on disk; nothing new to write
+                if latest_data:
+                    print("⚠️ Parsed empty this iteration — keeping last valid snapshot.")
                 else:
                     print("⚠️ Parsed empty and no last valid snapshot available yet.")
 
             
-            for _ in range(int(POLL_INTERVAL * 10)):
-                if stop_event.is_set():
-                    break
-                time.sleep(0.1)
+            if stop.wait(POLL_INTERVAL):
+                break
 
         except Exception as e:
             print("Scraper loop caught exception:", repr(e))
             
-            try:
-                if driver:
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
-                driver = None
-            except Exception:
-                driver = None
+            # Only recycle the page/context; relaunch the browser if it died
+            close_page(page)
+            page = None
+            if browser is not None and not browser.is_connected():
+                close_browser(pw, browser)
+                pw = browser = None
 
         
-            with latest_data_lock:
-                if latest_data:
-                    save_json_atomic(JSON_FILE, latest_data, backup_path=BACKUP_FILE)
-                    print("Saved last valid snapshot after error.")
-            time.sleep(min(backoff, 30))
-            backoff *= 2.0
+            if latest_data and save_snapshot(latest_data) == "written":
+                print("Saved last valid snapshot after error.")
+            failures += 1
+            if failures >= CIRCUIT_BREAKER_FAILURES:
+                # Stop churning: drop the browser entirely and cool down before relaunching
+                print(f"{failures} consecutive failures — cooling down for {CIRCUIT_BREAKER_COOLDOWN:.0f}s.")
+                close_browser(pw, browser)
+                pw = browser = None
+                delay = CIRCUIT_BREAKER_COOLDOWN
+                failures = 0
+                backoff = 1.0
+            else:
+                # Decorrelated jitter: random delay between 1s and 3x the previous one
+                backoff = min(MAX_BACKOFF, random.uniform(1.0, backoff * 3))
+                delay = backoff
+            if stop.wait(delay):
+                break
             continue
 
     
-    try:
-        if driver:
-            driver.quit()
-    except Exception:
-        pass
+    close_browser(pw, browser)
     print("Scraper loop stopped.")
 
 # -------------------------
-# Background updater
+# Scraper supervision
 # -------------------------
-def update_data_loop():
-    global latest_data
-    while not stop_event.is_set():
-        # Simulate new scraped data
-        new_data = {
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "price": round(random.uniform(50000, 60000), 2),
-            "volume": random.randint(1000, 5000)
-        }
-        with latest_data_lock:
-            latest_data = new_data
-        print(f"Data updated: {latest_data}")
-        time.sleep(POLL_INTERVAL)
-
+def supervise_scraper(stop=stop_event):
+    """
+    Run `scraper.py scrape` as a child process and restart it whenever it exits,
+    until stop is set. gunicorn.conf.py launches this instead of the scraper
+    itself: the gunicorn arbiter reaps all of its children, so only a separate
+    supervisor can see the scraper's real exit code.
+    """
+    child = None
+    while not stop.is_set():
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "scrape"])
+        print(f"Started scraper process (pid {child.pid})")
+        while child.poll() is None:
+            if stop.wait(SCRAPER_CHECK_INTERVAL):
+                break
+        if stop.is_set():
+            break
+        print(f"Scraper process exited with code {child.returncode}, restarting...")
+        stop.wait(SCRAPER_RESTART_DELAY)
 
+    if child is not None and child.poll() is None:
+        child.terminate()
+        try:
+            child.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            child.kill()
+    print("Scraper supervisor stopped.")
 
 # -------------------------
 # Flask API
@@ -230,43 +474,33 @@ app = Flask(__name__)
 
 @app.route("/health", methods=["GET"])
 def health():
-    return jsonify({"status": "ok"})
+    refresh_snapshot()
+    scraped_at = _snapshot_scraped_at
+    if scraped_at is None:
+        return jsonify({"status": "no data yet"}), 503
+    age = time.time() - scraped_at
+    status = {
+        "status": "ok" if age <= STALE_AFTER else "stale",
+        "last_scrape": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(scraped_at)),
+        "age_seconds": round(age, 1)
+    }
+    return jsonify(status), (200 if age <= STALE_AFTER else 503)
 
 @app.route("/htmlpage", methods=["GET"])
 def get_html_page():
-    with latest_data_lock:
-        if not latest_data:
-            return jsonify({"error": "No data yet"}), 503
-        
-        html_content = """
-        <meta http-equiv="refresh" content="1">
-        <h2>Crypto Market Data</h2>
-        <p>Last updated: {timestamp}</p>
-        <table border="1" cellpadding="5" cellspacing="0">
-            <tr>
-                <th>Pair</th>
-                <th>Price</th>
-                <th>Change (24h)</th>
-            </tr>
-            {rows}
-        </table>
-        """.format(
-            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-            rows="".join("<tr><td>{pair}</td><td>{price}</td><td>{change_24h}</td></tr>".format(**item) for item in latest_data)
-        )
-        return html_content
+    refresh_snapshot()
+    page = _html_payload
+    if not page:
+        return jsonify({"error": "No data yet"}), 503
+    return Response(page, mimetype="text/html")
 
 @app.route("/latest", methods=["GET"])
 def get_latest():
-    with latest_data_lock:
-        if not latest_data:
-            return jsonify({"error": "No data yet"}), 503
-        return jsonify({
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "count": len(latest_data),
-            "data": latest_data
-        })
-        return """<meta http-equiv="refresh" content="1" /> """
+    refresh_snapshot()
+    payload = _latest_payload
+    if not payload:
+        return jsonify({"error": "No data yet"}), 503
+    return Response(payload, mimetype="application/json")
 
 # -------------------------
 # Graceful shutdown handling
@@ -275,17 +509,25 @@ def handle_signal(sig, frame):
     print("Signal received, stopping...")
     stop_event.set()
 
-signal.signal(signal.SIGINT, handle_signal)
-signal.signal(signal.SIGTERM, handle_signal)
-
 # -------------------------
 # Main entry
 # -------------------------
 
 if __name__ == "__main__":
-    
-    t = Thread(target=scrape_loop, daemon=True)
-    t.start()
+    # Registered here, not at import, so gunicorn workers importing app keep their own handlers
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    if sys.argv[1:] == ["scrape"]:
+        scrape_loop()
+        sys.exit(0)
+    if sys.argv[1:] == ["supervise"]:
+        supervise_scraper()
+        sys.exit(0)
+
+    # Separate process: parsing and the browser never compete with request threads for the GIL
+    scraper = multiprocessing.Process(target=scrape_loop, args=(stop_event,), daemon=True)
+    scraper.start()
 
    
     print("Starting Flask server on http://0.0.0.0:5000 ...")
@@ -293,5 +535,5 @@ if __name__ == "__main__":
         app.run(host="0.0.0.0", port=5000, threaded=True)
     finally:
         stop_event.set()
-        t.join(timeout=5)
+        scraper.join(timeout=5)
         print("Exiting.")
@@ -0,0 +1,8 @@
+"""
+wsgi.py
+
+WSGI entry point for production serving:
+    gunicorn -c gunicorn.conf.py wsgi:app
+The scraper itself is started by the gunicorn.conf.py hooks.
+"""
+from scraper import app